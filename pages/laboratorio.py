@@ -589,6 +589,9 @@ class LaboratorioPage(tk.Frame):
             self.ejercicio_actual, respuestas_dict
         )
         
+        # Ya evaluado: el generador no necesita retener el ejercicio ni sus respuestas
+        self.generator.liberar()
+        
         # Mostrar resultados
         reporte = self.evaluador.generar_reporte(
             self.ejercicio_actual, resultados
@@ -2,8 +2,765 @@
 Generador automático de ejercicios educacionales para sistemas dinámicos.
 """
 
+import bisect
+import math
 import random
-import numpy as np
+from dataclasses import asdict, dataclass, replace
+
+
+# Constantes numéricas
+# Tiempo hasta el 37% de la diferencia inicial, en unidades de 1/k (Newton)
+_MENOS_LOG_037 = -math.log(0.37)
+# β clásico del sistema de Lorenz
+_BETA_LORENZ = 8 / 3
+# Valor de μ en el que ocurre la bifurcación de Hopf
+_MU_HOPF = 0.0
+# Umbrales de r en el mapa de Verhulst: punto fijo | periódico | caos
+_VERHULST_UMBRALES = (3.0, 3.57)
+# Umbrales de ζ del amortiguador: subamortiguado | críticamente amortiguado | sobreamortiguado
+_ZETA_UMBRALES = (0.9, 1.1)
+# Amortiguamiento crítico 2·√(k·m) para los pares (m, k) fijos de los niveles 1 y 2
+_C_CRITICO = {
+    (1.0, 1.0): 2.0,
+    (1.0, 4.0): 4.0
+}
+
+# Niveles de dificultad
+_NIVELES = {
+    'principiante': 1,
+    'intermedio': 2,
+    'avanzado': 3
+}
+
+# Tipos de pregunta
+_TIPO_NUM = 'numerica'
+_TIPO_MC = 'opcion_multiple'
+
+# Opciones compartidas entre varias preguntas
+_OPT_SI_NO = ('Sí', 'No')
+_OPT_SI_NO_DEPENDE = ('Sí', 'No', 'Depende de los parámetros')
+_OPT_TIPOS_ATRACTOR = ('Un punto fijo', 'Un ciclo límite', 'Un atractor extraño')
+_OPT_SIR_POBLACIONES = ('Susceptibles', 'Infectados', 'Recuperados', 'Todas pueden aumentar')
+_OPT_NEWTON_EQUILIBRIO = ('Sí', 'No, se aproxima asintóticamente', 'Depende de k')
+_OPT_LINEAL_NO_LINEAL = ('Lineal', 'No lineal')
+_OPT_MAS_RAPIDO_LENTO = ('Más rápido', 'Más lento', 'Igual')
+_OPT_TIPOS_AMORTIGUAMIENTO = ('Subamortiguado', 'Críticamente amortiguado', 'Sobreamortiguado')
+
+# Opciones de preguntas cuya respuesta depende de los parámetros
+_OPT_SIR_EPIDEMIA = ('Sí, porque R₀ > 1', 'No, porque R₀ < 1', 'No se puede determinar')
+_OPT_VDP_CICLO = ('Sí', 'No', 'Depende de las condiciones iniciales')
+_OPT_VDP_COMPORTAMIENTO = ('Oscilación amortiguada', 'Oscilación sostenida (ciclo límite)', 'Divergente')
+_OPT_HOPF_COMPORTAMIENTO = ('Punto fijo estable', 'Ciclo límite estable', 'Comportamiento caótico')
+_OPT_VERHULST_COMPORTAMIENTO = ('Punto fijo', 'Oscilación periódica', 'Comportamiento caótico')
+_OPT_TIPOS_ORBITA = ('Circular', 'Elíptica', 'Hiperbólica', 'Parabólica')
+
+# Objetivos y análisis requeridos (fijos para cada sistema)
+_NEWTON_OBJETIVOS = (
+    'Comprender el proceso de enfriamiento exponencial',
+    'Analizar la influencia de la constante k',
+    'Predecir el tiempo de enfriamiento'
+)
+_NEWTON_ANALISIS = (
+    'Graficar la curva de temperatura vs tiempo',
+    'Identificar la constante de tiempo del sistema',
+    'Comparar con la solución analítica'
+)
+_VDP_OBJETIVOS = (
+    'Observar el comportamiento de ciclos límite',
+    'Analizar el efecto del parámetro μ',
+    'Estudiar el diagrama de fase'
+)
+_VDP_ANALISIS = (
+    'Graficar el diagrama de fase',
+    'Identificar puntos de equilibrio',
+    'Analizar la estabilidad del ciclo límite'
+)
+_SIR_OBJETIVOS = (
+    'Comprender la dinámica de epidemias',
+    'Calcular el número reproductivo básico R₀',
+    'Predecir el pico de infectados'
+)
+_SIR_ANALISIS = (
+    'Graficar las tres poblaciones',
+    'Calcular R₀ = β/γ',
+    'Determinar el día del pico de infectados'
+)
+_HOPF_OBJETIVOS = (
+    'Comprender la bifurcación de Hopf',
+    'Identificar el valor crítico del parámetro',
+    'Observar la transición a ciclo límite'
+)
+_HOPF_ANALISIS = (
+    'Graficar el diagrama de fase',
+    'Variar μ y observar cambios',
+    'Identificar el punto de bifurcación'
+)
+_LOGISTICO_OBJETIVOS = (
+    'Comprender el crecimiento logístico',
+    'Identificar la capacidad de carga',
+    'Analizar el efecto de la tasa de crecimiento'
+)
+_LOGISTICO_ANALISIS = (
+    'Graficar N(t) vs t',
+    'Identificar la capacidad de carga K',
+    'Calcular el punto de inflexión'
+)
+_VERHULST_OBJETIVOS = (
+    'Observar bifurcaciones en sistemas discretos',
+    'Comprender el camino al caos',
+    'Analizar el diagrama de bifurcación'
+)
+_VERHULST_ANALISIS = (
+    'Graficar la serie temporal',
+    'Construir el diagrama de bifurcación',
+    'Identificar las regiones periódicas y caóticas'
+)
+_ORBITAL_OBJETIVOS = (
+    'Comprender las leyes de Kepler',
+    'Analizar órbitas circulares y elípticas',
+    'Verificar la conservación de energía'
+)
+_ORBITAL_ANALISIS = (
+    'Graficar la trayectoria orbital',
+    'Calcular la energía total',
+    'Verificar las leyes de Kepler'
+)
+_MARIPOSA_OBJETIVOS = (
+    'Observar un atractor caótico',
+    'Comparar con el atractor de Lorenz',
+    'Analizar la estructura del atractor'
+)
+_MARIPOSA_ANALISIS = (
+    'Visualizar el atractor en 3D',
+    'Comparar con Lorenz',
+    'Analizar la sensibilidad a condiciones iniciales'
+)
+_AMORT_OBJETIVOS = (
+    'Comprender los tipos de amortiguamiento',
+    'Calcular el factor de amortiguamiento ζ',
+    'Analizar la respuesta del sistema'
+)
+_AMORT_ANALISIS = (
+    'Graficar x(t) y v(t)',
+    'Calcular ζ = c / (2√(km))',
+    'Determinar el tipo de amortiguamiento'
+)
+_RLC_OBJETIVOS = (
+    'Comprender circuitos RLC',
+    'Analizar oscilaciones eléctricas',
+    'Calcular la frecuencia de resonancia'
+)
+_RLC_ANALISIS = (
+    'Graficar I(t) y V_C(t)',
+    'Calcular ω₀ = 1/√(LC)',
+    'Determinar el factor de calidad Q'
+)
+_LORENZ_OBJETIVOS = (
+    'Observar comportamiento caótico',
+    'Comprender la teoría del caos',
+    'Analizar el atractor extraño'
+)
+_LORENZ_ANALISIS = (
+    'Visualizar el atractor en 3D',
+    'Probar diferentes condiciones iniciales',
+    'Observar la sensibilidad al caos'
+)
+
+# Instrucciones: una plantilla por sistema, una línea por paso
+_NEWTON_INSTRUCCIONES = (
+    '1. Configure la temperatura inicial en {T0}°C\n'
+    '2. Configure la temperatura ambiente en {T_env}°C\n'
+    '3. Configure la constante k en {k}\n'
+    '4. Ejecute la simulación y observe el comportamiento\n'
+    '5. Responda las preguntas basándose en los resultados'
+)
+_VDP_INSTRUCCIONES = (
+    '1. Configure μ = {mu}\n'
+    '2. Configure x(0) = {x0}, dx/dt(0) = {v0}\n'
+    '3. Ejecute la simulación\n'
+    '4. Observe el diagrama de fase\n'
+    '5. Analice si existe un ciclo límite'
+)
+_SIR_INSTRUCCIONES = (
+    '1. Configure S(0) = {S0}, I(0) = {I0}, R(0) = {R0}\n'
+    '2. Configure β = {beta}, γ = {gamma}\n'
+    '3. Ejecute la simulación\n'
+    '4. Observe la evolución de las poblaciones\n'
+    '5. Identifique el pico de infectados'
+)
+_HOPF_INSTRUCCIONES = (
+    '1. Configure μ = {mu}\n'
+    '2. Observe el comportamiento del sistema\n'
+    '3. Experimente con valores de μ negativos y positivos\n'
+    '4. Identifique el punto de bifurcación'
+)
+_LOGISTICO_INSTRUCCIONES = (
+    '1. Configure N(0) = {N0}\n'
+    '2. Configure r = {r}, K = {K}\n'
+    '3. Ejecute la simulación\n'
+    '4. Observe cómo la población se estabiliza'
+)
+_VERHULST_INSTRUCCIONES = (
+    '1. Configure r = {r}\n'
+    '2. Ejecute la simulación\n'
+    '3. Observe el comportamiento a largo plazo\n'
+    '4. Experimente con diferentes valores de r'
+)
+_ORBITAL_INSTRUCCIONES = (
+    '1. Configure posición inicial: ({x0}, {y0})\n'
+    '2. Configure velocidad inicial: ({vx0}, {vy0})\n'
+    '3. Ejecute la simulación\n'
+    '4. Observe la trayectoria orbital'
+)
+_MARIPOSA_INSTRUCCIONES = (
+    '1. Configure a = {a}, b = {b}, c = {c}\n'
+    '2. Ejecute la simulación\n'
+    '3. Observe el atractor en 3D\n'
+    '4. Identifique la forma de mariposa'
+)
+_AMORT_INSTRUCCIONES = (
+    '1. Configure m = {m}, c = {c}, k = {k}\n'
+    '2. Configure x(0) = 1.0, v(0) = 0.0\n'
+    '3. Ejecute la simulación\n'
+    '4. Observe el comportamiento'
+)
+_RLC_INSTRUCCIONES = (
+    '1. Configure R = {R}Ω, L = {L}H, C = {C}F\n'
+    '2. Configure V₀ = {V0}V\n'
+    '3. Ejecute la simulación\n'
+    '4. Observe corriente y voltaje'
+)
+_LORENZ_INSTRUCCIONES = (
+    '1. Configure σ = {sigma}, ρ = {rho}, β = {beta:.2f}\n'
+    '2. Ejecute la simulación\n'
+    '3. Observe el atractor en 3D\n'
+    '4. Analice la sensibilidad a condiciones iniciales'
+)
+
+# Textos de preguntas que dependen de los parámetros (se completan con format_map)
+_NEWTON_TEXTO_TIEMPO = '¿Cuánto tiempo aproximado tarda en llegar a {T_objetivo:.1f}°C?'
+_NEWTON_TEXTO_DOBLE_K = 'Si k fuera el doble ({k2}), ¿el enfriamiento sería más rápido o más lento?'
+_VDP_TEXTO_COMPORTAMIENTO = 'Con μ = {mu}, ¿qué tipo de comportamiento exhibe?'
+_SIR_TEXTO_EPIDEMIA = 'Con R₀ = {R0_basico:.2f}, ¿habrá epidemia?'
+_HOPF_TEXTO_COMPORTAMIENTO = 'Con μ = {mu}, ¿qué comportamiento exhibe el sistema?'
+_VERHULST_TEXTO_COMPORTAMIENTO = 'Con r = {r}, ¿qué comportamiento exhibe el sistema?'
+
+
+class _AccesoDict:
+    """
+    Acceso estilo diccionario sobre los campos de una dataclass.
+    
+    Mantiene compatible el código que usa ``pregunta['texto']`` o
+    ``pregunta.get('unidad', '')``. Un campo en None se trata como ausente.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, clave):
+        if clave not in self.__dataclass_fields__:
+            raise KeyError(clave)
+        return getattr(self, clave)
+    
+    def __contains__(self, clave):
+        return self.get(clave) is not None
+    
+    def get(self, clave, default=None):
+        """Devuelve el campo indicado o default si no existe o es None."""
+        if clave not in self.__dataclass_fields__:
+            return default
+        valor = getattr(self, clave)
+        return default if valor is None else valor
+    
+    def to_dict(self):
+        """
+        Convierte la instancia (y las dataclasses anidadas) en diccionarios.
+        
+        Returns:
+            Diccionario con todos los campos, listo para serializar
+        """
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class Pregunta(_AccesoDict):
+    """
+    Pregunta de un ejercicio.
+    
+    Las preguntas numéricas usan respuesta_esperada, tolerancia y unidad;
+    las de opción múltiple usan opciones y respuesta_correcta.
+    """
+    
+    id: int
+    texto: str
+    tipo: str
+    opciones: tuple | None = None
+    respuesta_correcta: int | None = None
+    respuesta_esperada: float | None = None
+    tolerancia: float | None = None
+    unidad: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Ejercicio(_AccesoDict):
+    """
+    Ejercicio completo generado para un sistema dinámico.
+    
+    Admite el acceso estilo diccionario (``ejercicio['titulo']``) que usan
+    la página de laboratorio, el evaluador y el estado de ejercicios.
+    Es inmutable porque el generador puede reutilizar una misma instancia.
+    """
+    
+    sistema: str
+    titulo: str
+    dificultad: str
+    parametros: dict
+    objetivos: tuple
+    instrucciones: tuple
+    preguntas: tuple
+    analisis_requerido: tuple
+
+
+# Preguntas que no dependen de los parámetros: Pregunta es inmutable, así que
+# se construyen una vez al importar y se comparten entre todos los ejercicios
+_HOPF_P_VALOR_CRITICO = Pregunta(
+    id=2,
+    texto='¿En qué valor de μ ocurre la bifurcación de Hopf?',
+    tipo=_TIPO_NUM,
+    respuesta_esperada=_MU_HOPF,
+    tolerancia=0.1,
+    unidad=''
+)
+_HOPF_P_ESTABILIDAD = Pregunta(
+    id=3,
+    texto='Para μ > 0, ¿el ciclo límite es estable o inestable?',
+    tipo=_TIPO_MC,
+    opciones=('Estable', 'Inestable'),
+    respuesta_correcta=0
+)
+_LOGISTICO_P_DOBLE_R = Pregunta(
+    id=3,
+    texto='Si r se duplica, ¿la población alcanza K más rápido o más lento?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_MAS_RAPIDO_LENTO,
+    respuesta_correcta=0
+)
+_VERHULST_P_INICIO_CAOS = Pregunta(
+    id=2,
+    texto='¿A partir de qué valor aproximado de r comienza el comportamiento caótico?',
+    tipo=_TIPO_NUM,
+    respuesta_esperada=_VERHULST_UMBRALES[-1],
+    tolerancia=0.1,
+    unidad=''
+)
+_VERHULST_P_TIPO_SISTEMA = Pregunta(
+    id=3,
+    texto='El mapa de Verhulst es un ejemplo de:',
+    tipo=_TIPO_MC,
+    opciones=('Sistema continuo', 'Sistema discreto', 'Sistema híbrido'),
+    respuesta_correcta=1
+)
+_ORBITAL_P_ENERGIA = Pregunta(
+    id=2,
+    texto='¿La energía total del sistema se conserva?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_SI_NO,
+    respuesta_correcta=0
+)
+_ORBITAL_P_FUERZA = Pregunta(
+    id=3,
+    texto='¿Qué fuerza actúa sobre el cuerpo orbital?',
+    tipo=_TIPO_MC,
+    opciones=('Gravitacional', 'Electromagnética', 'Nuclear'),
+    respuesta_correcta=0
+)
+
+_NEWTON_P_EQUILIBRIO = Pregunta(
+    id=2,
+    texto='¿La temperatura alcanza exactamente la temperatura ambiente?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_NEWTON_EQUILIBRIO,
+    respuesta_correcta=1
+)
+_VDP_P_LINEALIDAD = Pregunta(
+    id=3,
+    texto='¿El sistema es lineal o no lineal?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_LINEAL_NO_LINEAL,
+    respuesta_correcta=1
+)
+_SIR_P_POBLACION = Pregunta(
+    id=3,
+    texto='¿Qué población nunca aumenta en el modelo SIR?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_SIR_POBLACIONES,
+    respuesta_correcta=0
+)
+_MARIPOSA_P_CAOTICO = Pregunta(
+    id=1,
+    texto='¿El sistema de Rössler es caótico?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_SI_NO_DEPENDE,
+    respuesta_correcta=2
+)
+_MARIPOSA_P_DIMENSIONES = Pregunta(
+    id=2,
+    texto='¿Cuántas dimensiones tiene el sistema?',
+    tipo=_TIPO_NUM,
+    respuesta_esperada=3,
+    tolerancia=0,
+    unidad=''
+)
+_MARIPOSA_P_ATRACTOR = Pregunta(
+    id=3,
+    texto='El atractor de Rössler es:',
+    tipo=_TIPO_MC,
+    opciones=_OPT_TIPOS_ATRACTOR,
+    respuesta_correcta=2
+)
+_LORENZ_P_DETERMINISTA = Pregunta(
+    id=1,
+    texto='¿El sistema de Lorenz es determinista o estocástico?',
+    tipo=_TIPO_MC,
+    opciones=('Determinista', 'Estocástico'),
+    respuesta_correcta=0
+)
+
+# Plantillas de preguntas con texto fijo y respuesta dependiente de los
+# parámetros: se completan con dataclasses.replace al generar el ejercicio
+_VDP_P_CICLO = Pregunta(
+    id=1,
+    texto='¿El sistema converge a un ciclo límite?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_VDP_CICLO
+)
+_SIR_P_R0 = Pregunta(
+    id=1,
+    texto='¿Cuál es el valor de R₀ (número reproductivo básico)?',
+    tipo=_TIPO_NUM,
+    tolerancia=0.2,
+    unidad=''
+)
+_AMORT_P_TIPO = Pregunta(
+    id=1,
+    texto='¿Qué tipo de amortiguamiento presenta el sistema?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_TIPOS_AMORTIGUAMIENTO
+)
+_AMORT_P_ZETA = Pregunta(
+    id=2,
+    texto='¿Cuál es el factor de amortiguamiento ζ?',
+    tipo=_TIPO_NUM,
+    tolerancia=0.1,
+    unidad=''
+)
+_AMORT_P_OSCILA = Pregunta(
+    id=3,
+    texto='¿El sistema oscila?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_SI_NO
+)
+_RLC_P_RESONANCIA = Pregunta(
+    id=1,
+    texto='¿Cuál es la frecuencia de resonancia ω₀ = 1/√(LC)?',
+    tipo=_TIPO_NUM,
+    tolerancia=5.0,
+    unidad='rad/s'
+)
+_RLC_P_AMORTIGUAMIENTO = Pregunta(
+    id=2,
+    texto='¿El circuito está subamortiguado, críticamente amortiguado o sobreamortiguado?',
+    tipo=_TIPO_MC,
+    opciones=_OPT_TIPOS_AMORTIGUAMIENTO
+)
+_LORENZ_P_CAOS = Pregunta(
+    id=2,
+    texto='Para ρ > 24.74, ¿qué comportamiento exhibe?',
+    tipo=_TIPO_MC,
+    opciones=('Punto fijo', 'Ciclo límite', 'Comportamiento caótico')
+)
+
+
+def _respuestas_newton(T0, T_env, k):
+    """
+    Calcula las respuestas numéricas del ejercicio de Newton.
+    
+    Args:
+        T0: Temperatura inicial
+        T_env: Temperatura ambiente
+        k: Constante de enfriamiento
+        
+    Returns:
+        Tupla (T_objetivo, t_esperado)
+    """
+    # Aproximadamente 1 constante de tiempo: el cociente de diferencias es
+    # siempre 0.37, así que el logaritmo es una constante del módulo
+    T_objetivo = T_env + (T0 - T_env) * 0.37
+    t_esperado = _MENOS_LOG_037 / k
+    return T_objetivo, t_esperado
+
+
+# Muestreo de parámetros: una función por (sistema, nivel), sin cadenas if/elif
+def _muestrear_newton_1(rng):
+    """Newton, principiante. Devuelve (T0, T_env, k)."""
+    T0 = rng.choice((100, 90, 80))
+    T_env = rng.choice((20, 25))
+    k = rng.randint(5, 15) / 100
+    return T0, T_env, k
+
+
+def _muestrear_newton_2(rng):
+    """Newton, intermedio. Devuelve (T0, T_env, k)."""
+    T0 = rng.randint(70, 120)
+    T_env = rng.randint(15, 30)
+    k = rng.randint(80, 250) / 1000
+    return T0, T_env, k
+
+
+def _muestrear_newton_3(rng):
+    """Newton, avanzado. Devuelve (T0, T_env, k)."""
+    T0 = rng.randint(60, 150)
+    T_env = rng.randint(10, 35)
+    k = rng.randint(50, 400) / 1000
+    return T0, T_env, k
+
+
+def _muestrear_van_der_pol_1(rng):
+    """Van der Pol, principiante. Devuelve (mu, x0, v0)."""
+    return rng.choice((0.5, 1.0, 1.5)), 1.0, 0.0
+
+
+def _muestrear_van_der_pol_2(rng):
+    """Van der Pol, intermedio. Devuelve (mu, x0, v0)."""
+    mu = rng.randint(5, 30) / 10
+    x0 = rng.randint(-20, 20) / 10
+    v0 = rng.randint(-10, 10) / 10
+    return mu, x0, v0
+
+
+def _muestrear_van_der_pol_3(rng):
+    """Van der Pol, avanzado. Devuelve (mu, x0, v0)."""
+    mu = rng.randint(20, 800) / 100
+    x0 = rng.randint(-30, 30) / 10
+    v0 = rng.randint(-20, 20) / 10
+    return mu, x0, v0
+
+
+def _muestrear_sir_1(rng):
+    """SIR, principiante. Devuelve (S0, I0, R0, beta, gamma)."""
+    return 990, 10, 0, 0.3, 0.1
+
+
+def _muestrear_sir_2(rng):
+    """SIR, intermedio. Devuelve (S0, I0, R0, beta, gamma)."""
+    S0 = rng.randint(900, 990)
+    beta = rng.randint(20, 50) / 100
+    gamma = rng.randint(5, 20) / 100
+    return S0, 1000 - S0, 0, beta, gamma
+
+
+def _muestrear_sir_3(rng):
+    """SIR, avanzado. Devuelve (S0, I0, R0, beta, gamma)."""
+    S0 = rng.randint(800, 990)
+    I0 = rng.randint(5, 50)
+    beta = rng.randint(15, 70) / 100
+    gamma = rng.randint(5, 30) / 100
+    return S0, I0, 1000 - S0 - I0, beta, gamma
+
+
+def _muestrear_hopf_1(rng):
+    """Hopf, principiante. Devuelve mu."""
+    return rng.choice((-0.5, 0.0, 0.5, 1.0))
+
+
+def _muestrear_hopf_2(rng):
+    """Hopf, intermedio. Devuelve mu."""
+    return rng.randint(-10, 20) / 10
+
+
+def _muestrear_hopf_3(rng):
+    """Hopf, avanzado. Devuelve mu."""
+    return rng.randint(-200, 300) / 100
+
+
+def _muestrear_logistico_1(rng):
+    """Logístico, principiante. Devuelve (N0, K, r)."""
+    N0 = rng.choice((10, 20, 50))
+    r = rng.choice((0.1, 0.2, 0.3))
+    return N0, 1000, r
+
+
+def _muestrear_logistico_2(rng):
+    """Logístico, intermedio. Devuelve (N0, K, r)."""
+    N0 = rng.randint(10, 100)
+    K = rng.randint(500, 1500)
+    r = rng.randint(10, 50) / 100
+    return N0, K, r
+
+
+def _muestrear_logistico_3(rng):
+    """Logístico, avanzado. Devuelve (N0, K, r)."""
+    N0 = rng.randint(5, 200)
+    K = rng.randint(300, 2000)
+    r = rng.randint(50, 800) / 1000
+    return N0, K, r
+
+
+def _muestrear_verhulst_1(rng):
+    """Verhulst, principiante. Devuelve r."""
+    return rng.choice((2.5, 3.0, 3.2))
+
+
+def _muestrear_verhulst_2(rng):
+    """Verhulst, intermedio. Devuelve r."""
+    return rng.randint(28, 36) / 10
+
+
+def _muestrear_verhulst_3(rng):
+    """Verhulst, avanzado. Devuelve r."""
+    return rng.randint(340, 400) / 100
+
+
+def _muestrear_orbital_1(rng):
+    """Órbita circular. Devuelve (x0, y0, vx0, vy0)."""
+    return 1.0, 0.0, 0.0, 1.0
+
+
+def _muestrear_orbital_2(rng):
+    """Órbita elíptica. Devuelve (x0, y0, vx0, vy0)."""
+    return 1.0, 0.0, 0.0, rng.randint(70, 130) / 100
+
+
+def _muestrear_orbital_3(rng):
+    """Órbita variada. Devuelve (x0, y0, vx0, vy0)."""
+    x0 = rng.randint(50, 200) / 100
+    vy0 = rng.randint(50, 150) / 100
+    return x0, 0.0, 0.0, vy0
+
+
+def _muestrear_mariposa_1(rng):
+    """Rössler, principiante. Devuelve (a, b, c)."""
+    return 0.2, 0.2, 5.7
+
+
+def _muestrear_mariposa_2(rng):
+    """Rössler, intermedio. Devuelve (a, b, c)."""
+    return 0.2, 0.2, rng.randint(40, 65) / 10
+
+
+def _muestrear_mariposa_3(rng):
+    """Rössler, avanzado. Devuelve (a, b, c)."""
+    a = rng.randint(10, 30) / 100
+    b = rng.randint(10, 40) / 100
+    c = rng.randint(30, 80) / 10
+    return a, b, c
+
+
+def _muestrear_amortiguador_1(rng):
+    """Amortiguador, principiante. Devuelve (m, k, c)."""
+    # Sub, crítico, sobre
+    return 1.0, 1.0, rng.choice((0.2, 1.0, 2.0))
+
+
+def _muestrear_amortiguador_2(rng):
+    """Amortiguador, intermedio. Devuelve (m, k, c)."""
+    return 1.0, 4.0, rng.randint(5, 60) / 10
+
+
+def _muestrear_amortiguador_3(rng):
+    """Amortiguador, avanzado. Devuelve (m, k, c)."""
+    m = rng.randint(5, 20) / 10
+    k = rng.randint(10, 100) / 10
+    c = rng.randint(10, 800) / 100
+    return m, k, c
+
+
+def _muestrear_rlc_1(rng):
+    """RLC, principiante. Devuelve (R, L, C, V0)."""
+    return 10.0, 0.1, 0.001, 10.0
+
+
+def _muestrear_rlc_2(rng):
+    """RLC, intermedio. Devuelve (R, L, C, V0)."""
+    R = rng.randint(5, 50)
+    L = rng.randint(5, 50) / 100
+    C = rng.randint(5, 50) / 10000
+    V0 = rng.randint(5, 20)
+    return R, L, C, V0
+
+
+def _muestrear_rlc_3(rng):
+    """RLC, avanzado. Devuelve (R, L, C, V0)."""
+    R = rng.randint(1, 100)
+    L = rng.randint(1, 100) / 100
+    C = rng.randint(1, 100) / 10000
+    V0 = rng.randint(1, 50)
+    return R, L, C, V0
+
+
+def _muestrear_lorenz_1(rng):
+    """Lorenz, principiante. Devuelve (sigma, rho, beta)."""
+    return 10.0, 28.0, _BETA_LORENZ
+
+
+def _muestrear_lorenz_2(rng):
+    """Lorenz, intermedio. Devuelve (sigma, rho, beta)."""
+    return 10.0, rng.randint(200, 350) / 10, _BETA_LORENZ
+
+
+def _muestrear_lorenz_3(rng):
+    """Lorenz, avanzado. Devuelve (sigma, rho, beta)."""
+    sigma = rng.randint(80, 150) / 10
+    rho = rng.randint(150, 400) / 10
+    beta = rng.randint(200, 350) / 100
+    return sigma, rho, beta
+
+
+_MUESTREADORES = {
+    ('newton', 1): _muestrear_newton_1,
+    ('newton', 2): _muestrear_newton_2,
+    ('newton', 3): _muestrear_newton_3,
+    ('van_der_pol', 1): _muestrear_van_der_pol_1,
+    ('van_der_pol', 2): _muestrear_van_der_pol_2,
+    ('van_der_pol', 3): _muestrear_van_der_pol_3,
+    ('sir', 1): _muestrear_sir_1,
+    ('sir', 2): _muestrear_sir_2,
+    ('sir', 3): _muestrear_sir_3,
+    ('hopf', 1): _muestrear_hopf_1,
+    ('hopf', 2): _muestrear_hopf_2,
+    ('hopf', 3): _muestrear_hopf_3,
+    ('logistico', 1): _muestrear_logistico_1,
+    ('logistico', 2): _muestrear_logistico_2,
+    ('logistico', 3): _muestrear_logistico_3,
+    ('verhulst', 1): _muestrear_verhulst_1,
+    ('verhulst', 2): _muestrear_verhulst_2,
+    ('verhulst', 3): _muestrear_verhulst_3,
+    ('orbital', 1): _muestrear_orbital_1,
+    ('orbital', 2): _muestrear_orbital_2,
+    ('orbital', 3): _muestrear_orbital_3,
+    ('mariposa', 1): _muestrear_mariposa_1,
+    ('mariposa', 2): _muestrear_mariposa_2,
+    ('mariposa', 3): _muestrear_mariposa_3,
+    ('amortiguador', 1): _muestrear_amortiguador_1,
+    ('amortiguador', 2): _muestrear_amortiguador_2,
+    ('amortiguador', 3): _muestrear_amortiguador_3,
+    ('rlc', 1): _muestrear_rlc_1,
+    ('rlc', 2): _muestrear_rlc_2,
+    ('rlc', 3): _muestrear_rlc_3,
+    ('lorenz', 1): _muestrear_lorenz_1,
+    ('lorenz', 2): _muestrear_lorenz_2,
+    ('lorenz', 3): _muestrear_lorenz_3
+}
+
+
+# Combinaciones (sistema, dificultad) cuyos parámetros son fijos: el ejercicio
+# generado siempre es el mismo, así que se arma una sola vez por generador
+_EJERCICIOS_FIJOS = frozenset({
+    ('sir', 'principiante'),
+    ('orbital', 'principiante'),
+    ('mariposa', 'principiante'),
+    ('rlc', 'principiante'),
+    ('lorenz', 'principiante')
+})
 
 
 class EjercicioGenerator:
@@ -12,17 +769,38 @@ class EjercicioGenerator:
     preguntas teóricas y objetivos de aprendizaje.
     """
     
-    # Niveles de dificultad
-    DIFICULTAD = {
-        'principiante': 1,
-        'intermedio': 2,
-        'avanzado': 3
+    # Niveles de dificultad (alias público de la tabla del módulo)
+    DIFICULTAD = _NIVELES
+    
+    # Método generador de cada sistema (se resuelve con getattr)
+    _GENERADORES = {
+        'newton': '_generar_newton',
+        'van_der_pol': '_generar_van_der_pol',
+        'sir': '_generar_sir',
+        'rlc': '_generar_rlc',
+        'lorenz': '_generar_lorenz',
+        'hopf': '_generar_hopf',
+        'logistico': '_generar_logistico',
+        'verhulst': '_generar_verhulst',
+        'orbital': '_generar_orbital',
+        'mariposa': '_generar_mariposa',
+        'amortiguador': '_generar_amortiguador'
     }
     
-    def __init__(self):
-        """Inicializa el generador de ejercicios."""
+    def __init__(self, semilla=None):
+        """
+        Inicializa el generador de ejercicios.
+        
+        Args:
+            semilla: Semilla opcional para obtener ejercicios reproducibles
+        """
         self.ejercicio_actual = None
+        # Respuestas del último ejercicio de cada sistema: {sistema: {id: respuesta}}
         self.respuestas_esperadas = {}
+        # Generador propio: no comparte el estado global del módulo random
+        self._rng = random.Random(semilla)
+        # Ejercicios de parámetros fijos ya generados, por (sistema, dificultad)
+        self._ejercicios_fijos = {}
     
     def generar_ejercicio(self, sistema, dificultad='intermedio'):
         """
@@ -33,547 +811,432 @@ class EjercicioGenerator:
             dificultad: Nivel de dificultad
             
         Returns:
-            Diccionario con el ejercicio completo
+            Instancia de Ejercicio con parámetros, instrucciones y preguntas
         """
-        generadores = {
-            'newton': self._generar_newton,
-            'van_der_pol': self._generar_van_der_pol,
-            'sir': self._generar_sir,
-            'rlc': self._generar_rlc,
-            'lorenz': self._generar_lorenz,
-            'hopf': self._generar_hopf,
-            'logistico': self._generar_logistico,
-            'verhulst': self._generar_verhulst,
-            'orbital': self._generar_orbital,
-            'mariposa': self._generar_mariposa,
-            'amortiguador': self._generar_amortiguador
+        generar = self._obtener_generador(sistema)
+        nivel = self._obtener_nivel(dificultad)
+        ejercicio = self._generar(generar, sistema, dificultad, nivel)
+        self.ejercicio_actual = ejercicio
+        self.respuestas_esperadas[sistema] = {
+            p.id: (
+                p.respuesta_esperada if p.respuesta_esperada is not None
+                else p.respuesta_correcta
+            )
+            for p in ejercicio.preguntas
         }
+        return ejercicio
+    
+    def generar_lote(self, sistema, dificultad='intermedio', n=10):
+        """
+        Genera varios ejercicios del mismo sistema y dificultad.
         
-        if sistema not in generadores:
-            raise ValueError(f"Sistema '{sistema}' no soportado")
+        Pensado para armar bancos de ejercicios: el generador se resuelve una
+        sola vez para todo el lote y no se modifica ejercicio_actual.
         
-        ejercicio = generadores[sistema](dificultad)
-        self.ejercicio_actual = ejercicio
+        Args:
+            sistema: Nombre del sistema
+            dificultad: Nivel de dificultad
+            n: Cantidad de ejercicios a generar
+            
+        Returns:
+            Lista de Ejercicio
+        """
+        generar = self._obtener_generador(sistema)
+        nivel = self._obtener_nivel(dificultad)
+        return [self._generar(generar, sistema, dificultad, nivel) for _ in range(n)]
+    
+    def generar_todos(self, especificaciones):
+        """
+        Genera un ejercicio por cada par (sistema, dificultad) indicado.
+        
+        Útil para armar una guía con varios sistemas de una vez. Cada sistema
+        se valida y resuelve una sola vez; no se modifica ejercicio_actual.
+        
+        Args:
+            especificaciones: Iterable de tuplas (sistema, dificultad)
+            
+        Returns:
+            Lista de Ejercicio, en el mismo orden que las especificaciones
+        """
+        generadores = {}
+        ejercicios = []
+        for sistema, dificultad in especificaciones:
+            generar = generadores.get(sistema)
+            if generar is None:
+                generar = generadores[sistema] = self._obtener_generador(sistema)
+            nivel = self._obtener_nivel(dificultad)
+            ejercicios.append(self._generar(generar, sistema, dificultad, nivel))
+        return ejercicios
+    
+    def _generar(self, generar, sistema, dificultad, nivel):
+        """
+        Llama al generador, reutilizando los ejercicios de parámetros fijos.
+        
+        Args:
+            generar: Método generador del sistema
+            sistema: Nombre del sistema
+            dificultad: Nivel de dificultad
+            nivel: Número de nivel (1, 2 o 3) ya resuelto
+            
+        Returns:
+            Ejercicio generado (o el ya generado, si sus parámetros son fijos)
+        """
+        clave = (sistema, dificultad)
+        if clave not in _EJERCICIOS_FIJOS:
+            return generar(dificultad, nivel)
+        
+        ejercicio = self._ejercicios_fijos.get(clave)
+        if ejercicio is None:
+            ejercicio = self._ejercicios_fijos[clave] = generar(dificultad, nivel)
         return ejercicio
     
-    def _generar_newton(self, dificultad):
-        """Genera ejercicio de enfriamiento de Newton."""
-        nivel = self.DIFICULTAD[dificultad]
+    def _obtener_generador(self, sistema):
+        """
+        Devuelve el método que genera ejercicios del sistema indicado.
+        
+        Raises:
+            ValueError: Si el sistema no está soportado
+        """
+        nombre = self._GENERADORES.get(sistema)
+        if nombre is None:
+            raise ValueError(f"Sistema '{sistema}' no soportado")
+        
+        return getattr(self, nombre)
+    
+    @staticmethod
+    def _obtener_nivel(dificultad):
+        """
+        Devuelve el número de nivel (1, 2 o 3) de una dificultad.
+        
+        Raises:
+            ValueError: Si la dificultad no existe
+        """
+        nivel = _NIVELES.get(dificultad)
+        if nivel is None:
+            raise ValueError(f"Dificultad '{dificultad}' no soportada")
         
+        return nivel
+    
+    def set_semilla(self, semilla):
+        """
+        Reinicia el generador de números aleatorios con una semilla.
+        
+        A partir de aquí la secuencia de ejercicios es reproducible.
+        
+        Args:
+            semilla: Semilla para el generador (None para una aleatoria)
+        """
+        self._rng.seed(semilla)
+    
+    def liberar(self):
+        """
+        Libera las referencias al último ejercicio generado.
+        
+        ejercicio_actual y respuestas_esperadas solo son referencias de
+        conveniencia; quien consume el ejercicio debería llamar a este método
+        una vez que lo evaluó.
+        """
+        self.ejercicio_actual = None
+        self.respuestas_esperadas.clear()
+    
+    @staticmethod
+    def _construir_ejercicio(sistema, titulo, dificultad, parametros, objetivos,
+                             instrucciones, preguntas, analisis_requerido):
+        """
+        Arma el ejercicio a partir de sus partes.
+        
+        Las listas de textos se congelan como tuplas: nunca se modifican y
+        las que ya son constantes del módulo se comparten sin copiarse.
+        
+        Returns:
+            Instancia de Ejercicio
+        """
+        return Ejercicio(
+            sistema=sistema,
+            titulo=titulo,
+            dificultad=dificultad,
+            parametros=parametros,
+            objetivos=tuple(objetivos),
+            instrucciones=tuple(instrucciones),
+            preguntas=tuple(preguntas),
+            analisis_requerido=tuple(analisis_requerido)
+        )
+    
+    def _generar_newton(self, dificultad, nivel):
+        """Genera ejercicio de enfriamiento de Newton."""
         # Parámetros según dificultad
-        if nivel == 1:
-            T0 = random.choice([100, 90, 80])
-            T_env = random.choice([20, 25])
-            k = round(random.uniform(0.05, 0.15), 2)
-        elif nivel == 2:
-            T0 = random.randint(70, 120)
-            T_env = random.randint(15, 30)
-            k = round(random.uniform(0.08, 0.25), 3)
-        else:
-            T0 = random.randint(60, 150)
-            T_env = random.randint(10, 35)
-            k = round(random.uniform(0.05, 0.4), 3)
+        T0, T_env, k = _MUESTREADORES[('newton', nivel)](self._rng)
         
         # Calcular tiempo esperado para llegar a cierta temperatura
-        T_objetivo = T_env + (T0 - T_env) * 0.37  # Aproximadamente 1 constante de tiempo
-        t_esperado = -np.log((T_objetivo - T_env) / (T0 - T_env)) / k
-        
-        ejercicio = {
-            'sistema': 'newton',
-            'titulo': 'Ley de Enfriamiento de Newton',
-            'dificultad': dificultad,
-            'parametros': {
+        T_objetivo, t_esperado = _respuestas_newton(T0, T_env, k)
+        valores = {
+            'T0': T0, 'T_env': T_env, 'k': k,
+            'T_objetivo': T_objetivo, 'k2': 2 * k
+        }
+        
+        ejercicio = self._construir_ejercicio(
+            sistema='newton',
+            titulo='Ley de Enfriamiento de Newton',
+            dificultad=dificultad,
+            parametros={
                 'T0': T0,
                 'T_env': T_env,
                 'k': k
             },
-            'objetivos': [
-                'Comprender el proceso de enfriamiento exponencial',
-                'Analizar la influencia de la constante k',
-                'Predecir el tiempo de enfriamiento'
-            ],
-            'instrucciones': [
-                f'1. Configure la temperatura inicial en {T0}°C',
-                f'2. Configure la temperatura ambiente en {T_env}°C',
-                f'3. Configure la constante k en {k}',
-                '4. Ejecute la simulación y observe el comportamiento',
-                '5. Responda las preguntas basándose en los resultados'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': f'¿Cuánto tiempo aproximado tarda en llegar a {T_objetivo:.1f}°C?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': t_esperado,
-                    'tolerancia': 2.0,
-                    'unidad': 'minutos'
-                },
-                {
-                    'id': 2,
-                    'texto': '¿La temperatura alcanza exactamente la temperatura ambiente?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Sí', 'No, se aproxima asintóticamente', 'Depende de k'],
-                    'respuesta_correcta': 1
-                },
-                {
-                    'id': 3,
-                    'texto': f'Si k fuera el doble ({2*k}), ¿el enfriamiento sería más rápido o más lento?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Más rápido', 'Más lento', 'Igual'],
-                    'respuesta_correcta': 0
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar la curva de temperatura vs tiempo',
-                'Identificar la constante de tiempo del sistema',
-                'Comparar con la solución analítica'
-            ]
-        }
+            objetivos=_NEWTON_OBJETIVOS,
+            instrucciones=_NEWTON_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                Pregunta(
+                    id=1,
+                    texto=_NEWTON_TEXTO_TIEMPO.format_map(valores),
+                    tipo=_TIPO_NUM,
+                    respuesta_esperada=t_esperado,
+                    tolerancia=2.0,
+                    unidad='minutos'
+                ),
+                _NEWTON_P_EQUILIBRIO,
+                Pregunta(
+                    id=3,
+                    texto=_NEWTON_TEXTO_DOBLE_K.format_map(valores),
+                    tipo=_TIPO_MC,
+                    opciones=_OPT_MAS_RAPIDO_LENTO,
+                    respuesta_correcta=0
+                )
+            ),
+            analisis_requerido=_NEWTON_ANALISIS
+        )
         
-        self.respuestas_esperadas['newton'] = ejercicio
         return ejercicio
     
-    def _generar_van_der_pol(self, dificultad):
+    def _generar_van_der_pol(self, dificultad, nivel):
         """Genera ejercicio del oscilador de Van der Pol."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            mu = random.choice([0.5, 1.0, 1.5])
-            x0, v0 = 1.0, 0.0
-        elif nivel == 2:
-            mu = round(random.uniform(0.5, 3.0), 1)
-            x0 = round(random.uniform(-2, 2), 1)
-            v0 = round(random.uniform(-1, 1), 1)
-        else:
-            mu = round(random.uniform(0.2, 8.0), 2)
-            x0 = round(random.uniform(-3, 3), 1)
-            v0 = round(random.uniform(-2, 2), 1)
-        
-        ejercicio = {
-            'sistema': 'van_der_pol',
-            'titulo': 'Oscilador de Van der Pol',
-            'dificultad': dificultad,
-            'parametros': {
+        mu, x0, v0 = _MUESTREADORES[('van_der_pol', nivel)](self._rng)
+        
+        valores = {'mu': mu, 'x0': x0, 'v0': v0}
+        
+        # Respuestas que dependen de μ, resueltas una sola vez
+        resp_ciclo = int(mu <= 0)
+        resp_comportamiento = int(mu > 0)
+        
+        ejercicio = self._construir_ejercicio(
+            sistema='van_der_pol',
+            titulo='Oscilador de Van der Pol',
+            dificultad=dificultad,
+            parametros={
                 'mu': mu,
                 'x0': x0,
                 'v0': v0
             },
-            'objetivos': [
-                'Observar el comportamiento de ciclos límite',
-                'Analizar el efecto del parámetro μ',
-                'Estudiar el diagrama de fase'
-            ],
-            'instrucciones': [
-                f'1. Configure μ = {mu}',
-                f'2. Configure x(0) = {x0}, dx/dt(0) = {v0}',
-                '3. Ejecute la simulación',
-                '4. Observe el diagrama de fase',
-                '5. Analice si existe un ciclo límite'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': '¿El sistema converge a un ciclo límite?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Sí', 'No', 'Depende de las condiciones iniciales'],
-                    'respuesta_correcta': 0 if mu > 0 else 1
-                },
-                {
-                    'id': 2,
-                    'texto': f'Con μ = {mu}, ¿qué tipo de comportamiento exhibe?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Oscilación amortiguada', 'Oscilación sostenida (ciclo límite)', 'Divergente'],
-                    'respuesta_correcta': 1 if mu > 0 else 0
-                },
-                {
-                    'id': 3,
-                    'texto': '¿El sistema es lineal o no lineal?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Lineal', 'No lineal'],
-                    'respuesta_correcta': 1
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar el diagrama de fase',
-                'Identificar puntos de equilibrio',
-                'Analizar la estabilidad del ciclo límite'
-            ]
-        }
+            objetivos=_VDP_OBJETIVOS,
+            instrucciones=_VDP_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                replace(_VDP_P_CICLO, respuesta_correcta=resp_ciclo),
+                Pregunta(
+                    id=2,
+                    texto=_VDP_TEXTO_COMPORTAMIENTO.format_map(valores),
+                    tipo=_TIPO_MC,
+                    opciones=_OPT_VDP_COMPORTAMIENTO,
+                    respuesta_correcta=resp_comportamiento
+                ),
+                _VDP_P_LINEALIDAD
+            ),
+            analisis_requerido=_VDP_ANALISIS
+        )
         
         return ejercicio
     
-    def _generar_sir(self, dificultad):
+    def _generar_sir(self, dificultad, nivel):
         """Genera ejercicio del modelo SIR."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            S0, I0, R0 = 990, 10, 0
-            beta = 0.3
-            gamma = 0.1
-        elif nivel == 2:
-            S0 = random.randint(900, 990)
-            I0 = 1000 - S0
-            R0 = 0
-            beta = round(random.uniform(0.2, 0.5), 2)
-            gamma = round(random.uniform(0.05, 0.2), 2)
-        else:
-            S0 = random.randint(800, 990)
-            I0 = random.randint(5, 50)
-            R0 = 1000 - S0 - I0
-            beta = round(random.uniform(0.15, 0.7), 2)
-            gamma = round(random.uniform(0.05, 0.3), 2)
+        S0, I0, R0, beta, gamma = _MUESTREADORES[('sir', nivel)](self._rng)
         
         R0_basico = beta / gamma
+        valores = {
+            'S0': S0, 'I0': I0, 'R0': R0, 'beta': beta, 'gamma': gamma,
+            'R0_basico': R0_basico
+        }
         
-        ejercicio = {
-            'sistema': 'sir',
-            'titulo': 'Modelo Epidemiológico SIR',
-            'dificultad': dificultad,
-            'parametros': {
+        ejercicio = self._construir_ejercicio(
+            sistema='sir',
+            titulo='Modelo Epidemiológico SIR',
+            dificultad=dificultad,
+            parametros={
                 'S0': S0,
                 'I0': I0,
                 'R0': R0,
                 'beta': beta,
                 'gamma': gamma
             },
-            'objetivos': [
-                'Comprender la dinámica de epidemias',
-                'Calcular el número reproductivo básico R₀',
-                'Predecir el pico de infectados'
-            ],
-            'instrucciones': [
-                f'1. Configure S(0) = {S0}, I(0) = {I0}, R(0) = {R0}',
-                f'2. Configure β = {beta}, γ = {gamma}',
-                '3. Ejecute la simulación',
-                '4. Observe la evolución de las poblaciones',
-                '5. Identifique el pico de infectados'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': f'¿Cuál es el valor de R₀ (número reproductivo básico)?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': R0_basico,
-                    'tolerancia': 0.2,
-                    'unidad': ''
-                },
-                {
-                    'id': 2,
-                    'texto': f'Con R₀ = {R0_basico:.2f}, ¿habrá epidemia?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Sí, porque R₀ > 1', 'No, porque R₀ < 1', 'No se puede determinar'],
-                    'respuesta_correcta': 0 if R0_basico > 1 else 1
-                },
-                {
-                    'id': 3,
-                    'texto': '¿Qué población nunca aumenta en el modelo SIR?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Susceptibles', 'Infectados', 'Recuperados', 'Todas pueden aumentar'],
-                    'respuesta_correcta': 0
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar las tres poblaciones',
-                'Calcular R₀ = β/γ',
-                'Determinar el día del pico de infectados'
-            ]
-        }
+            objetivos=_SIR_OBJETIVOS,
+            instrucciones=_SIR_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                replace(_SIR_P_R0, respuesta_esperada=R0_basico),
+                Pregunta(
+                    id=2,
+                    texto=_SIR_TEXTO_EPIDEMIA.format_map(valores),
+                    tipo=_TIPO_MC,
+                    opciones=_OPT_SIR_EPIDEMIA,
+                    respuesta_correcta=int(R0_basico <= 1)
+                ),
+                _SIR_P_POBLACION
+            ),
+            analisis_requerido=_SIR_ANALISIS
+        )
         
         return ejercicio
     
-    def _generar_hopf(self, dificultad):
+    def _generar_hopf(self, dificultad, nivel):
         """Genera ejercicio de bifurcación de Hopf."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            mu = random.choice([-0.5, 0.0, 0.5, 1.0])
-        elif nivel == 2:
-            mu = round(random.uniform(-1.0, 2.0), 1)
-        else:
-            mu = round(random.uniform(-2.0, 3.0), 2)
-        
-        ejercicio = {
-            'sistema': 'hopf',
-            'titulo': 'Bifurcación de Hopf',
-            'dificultad': dificultad,
-            'parametros': {
+        mu = _MUESTREADORES[('hopf', nivel)](self._rng)
+        
+        valores = {'mu': mu}
+        
+        ejercicio = self._construir_ejercicio(
+            sistema='hopf',
+            titulo='Bifurcación de Hopf',
+            dificultad=dificultad,
+            parametros={
                 'mu': mu,
                 'x0': 0.1,
                 'y0': 0.1,
                 'omega': 1.0
             },
-            'objetivos': [
-                'Comprender la bifurcación de Hopf',
-                'Identificar el valor crítico del parámetro',
-                'Observar la transición a ciclo límite'
-            ],
-            'instrucciones': [
-                f'1. Configure μ = {mu}',
-                '2. Observe el comportamiento del sistema',
-                '3. Experimente con valores de μ negativos y positivos',
-                '4. Identifique el punto de bifurcación'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': f'Con μ = {mu}, ¿qué comportamiento exhibe el sistema?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Punto fijo estable', 'Ciclo límite estable', 'Comportamiento caótico'],
-                    'respuesta_correcta': 0 if mu < 0 else 1
-                },
-                {
-                    'id': 2,
-                    'texto': '¿En qué valor de μ ocurre la bifurcación de Hopf?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': 0.0,
-                    'tolerancia': 0.1,
-                    'unidad': ''
-                },
-                {
-                    'id': 3,
-                    'texto': 'Para μ > 0, ¿el ciclo límite es estable o inestable?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Estable', 'Inestable'],
-                    'respuesta_correcta': 0
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar el diagrama de fase',
-                'Variar μ y observar cambios',
-                'Identificar el punto de bifurcación'
-            ]
-        }
+            objetivos=_HOPF_OBJETIVOS,
+            instrucciones=_HOPF_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                Pregunta(
+                    id=1,
+                    texto=_HOPF_TEXTO_COMPORTAMIENTO.format_map(valores),
+                    tipo=_TIPO_MC,
+                    opciones=_OPT_HOPF_COMPORTAMIENTO,
+                    respuesta_correcta=int(mu >= _MU_HOPF)
+                ),
+                _HOPF_P_VALOR_CRITICO,
+                _HOPF_P_ESTABILIDAD
+            ),
+            analisis_requerido=_HOPF_ANALISIS
+        )
         
         return ejercicio
     
-    def _generar_logistico(self, dificultad):
+    def _generar_logistico(self, dificultad, nivel):
         """Genera ejercicio del modelo logístico."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            N0 = random.choice([10, 20, 50])
-            K = 1000
-            r = random.choice([0.1, 0.2, 0.3])
-        elif nivel == 2:
-            N0 = random.randint(10, 100)
-            K = random.randint(500, 1500)
-            r = round(random.uniform(0.1, 0.5), 2)
-        else:
-            N0 = random.randint(5, 200)
-            K = random.randint(300, 2000)
-            r = round(random.uniform(0.05, 0.8), 3)
-        
-        ejercicio = {
-            'sistema': 'logistico',
-            'titulo': 'Modelo Logístico de Crecimiento',
-            'dificultad': dificultad,
-            'parametros': {
+        N0, K, r = _MUESTREADORES[('logistico', nivel)](self._rng)
+        
+        valores = {'N0': N0, 'r': r, 'K': K}
+        
+        ejercicio = self._construir_ejercicio(
+            sistema='logistico',
+            titulo='Modelo Logístico de Crecimiento',
+            dificultad=dificultad,
+            parametros={
                 'N0': N0,
                 'r': r,
                 'K': K
             },
-            'objetivos': [
-                'Comprender el crecimiento logístico',
-                'Identificar la capacidad de carga',
-                'Analizar el efecto de la tasa de crecimiento'
-            ],
-            'instrucciones': [
-                f'1. Configure N(0) = {N0}',
-                f'2. Configure r = {r}, K = {K}',
-                '3. Ejecute la simulación',
-                '4. Observe cómo la población se estabiliza'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': '¿Hacia qué valor tiende la población a largo plazo?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': K,
-                    'tolerancia': K * 0.05,
-                    'unidad': 'individuos'
-                },
-                {
-                    'id': 2,
-                    'texto': '¿En qué valor de N la tasa de crecimiento es máxima?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': K / 2,
-                    'tolerancia': K * 0.1,
-                    'unidad': 'individuos'
-                },
-                {
-                    'id': 3,
-                    'texto': 'Si r se duplica, ¿la población alcanza K más rápido o más lento?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Más rápido', 'Más lento', 'Igual'],
-                    'respuesta_correcta': 0
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar N(t) vs t',
-                'Identificar la capacidad de carga K',
-                'Calcular el punto de inflexión'
-            ]
-        }
+            objetivos=_LOGISTICO_OBJETIVOS,
+            instrucciones=_LOGISTICO_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                Pregunta(
+                    id=1,
+                    texto='¿Hacia qué valor tiende la población a largo plazo?',
+                    tipo=_TIPO_NUM,
+                    respuesta_esperada=K,
+                    tolerancia=K * 0.05,
+                    unidad='individuos'
+                ),
+                Pregunta(
+                    id=2,
+                    texto='¿En qué valor de N la tasa de crecimiento es máxima?',
+                    tipo=_TIPO_NUM,
+                    respuesta_esperada=K / 2,
+                    tolerancia=K * 0.1,
+                    unidad='individuos'
+                ),
+                _LOGISTICO_P_DOBLE_R
+            ),
+            analisis_requerido=_LOGISTICO_ANALISIS
+        )
         
         return ejercicio
     
-    def _generar_verhulst(self, dificultad):
+    def _generar_verhulst(self, dificultad, nivel):
         """Genera ejercicio del mapa de Verhulst."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            r = random.choice([2.5, 3.0, 3.2])
-        elif nivel == 2:
-            r = round(random.uniform(2.8, 3.6), 1)
-        else:
-            r = round(random.uniform(3.4, 4.0), 2)
-        
-        ejercicio = {
-            'sistema': 'verhulst',
-            'titulo': 'Mapa Logístico de Verhulst',
-            'dificultad': dificultad,
-            'parametros': {
+        r = _MUESTREADORES[('verhulst', nivel)](self._rng)
+        
+        valores = {'r': r}
+        
+        ejercicio = self._construir_ejercicio(
+            sistema='verhulst',
+            titulo='Mapa Logístico de Verhulst',
+            dificultad=dificultad,
+            parametros={
                 'x0': 0.5,
                 'r': r
             },
-            'objetivos': [
-                'Observar bifurcaciones en sistemas discretos',
-                'Comprender el camino al caos',
-                'Analizar el diagrama de bifurcación'
-            ],
-            'instrucciones': [
-                f'1. Configure r = {r}',
-                '2. Ejecute la simulación',
-                '3. Observe el comportamiento a largo plazo',
-                '4. Experimente con diferentes valores de r'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': f'Con r = {r}, ¿qué comportamiento exhibe el sistema?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Punto fijo', 'Oscilación periódica', 'Comportamiento caótico'],
-                    'respuesta_correcta': 0 if r < 3 else (1 if r < 3.57 else 2)
-                },
-                {
-                    'id': 2,
-                    'texto': '¿A partir de qué valor aproximado de r comienza el comportamiento caótico?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': 3.57,
-                    'tolerancia': 0.1,
-                    'unidad': ''
-                },
-                {
-                    'id': 3,
-                    'texto': 'El mapa de Verhulst es un ejemplo de:',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Sistema continuo', 'Sistema discreto', 'Sistema híbrido'],
-                    'respuesta_correcta': 1
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar la serie temporal',
-                'Construir el diagrama de bifurcación',
-                'Identificar las regiones periódicas y caóticas'
-            ]
-        }
+            objetivos=_VERHULST_OBJETIVOS,
+            instrucciones=_VERHULST_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                Pregunta(
+                    id=1,
+                    texto=_VERHULST_TEXTO_COMPORTAMIENTO.format_map(valores),
+                    tipo=_TIPO_MC,
+                    opciones=_OPT_VERHULST_COMPORTAMIENTO,
+                    respuesta_correcta=bisect.bisect_right(_VERHULST_UMBRALES, r)
+                ),
+                _VERHULST_P_INICIO_CAOS,
+                _VERHULST_P_TIPO_SISTEMA
+            ),
+            analisis_requerido=_VERHULST_ANALISIS
+        )
         
         return ejercicio
     
-    def _generar_orbital(self, dificultad):
+    def _generar_orbital(self, dificultad, nivel):
         """Genera ejercicio de órbitas espaciales."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            # Órbita circular
-            x0, y0 = 1.0, 0.0
-            vx0, vy0 = 0.0, 1.0
-        elif nivel == 2:
-            # Órbita elíptica
-            x0 = 1.0
-            y0 = 0.0
-            vx0 = 0.0
-            vy0 = round(random.uniform(0.7, 1.3), 2)
-        else:
-            # Órbita variada
-            x0 = round(random.uniform(0.5, 2.0), 2)
-            y0 = 0.0
-            vx0 = 0.0
-            vy0 = round(random.uniform(0.5, 1.5), 2)
-        
-        ejercicio = {
-            'sistema': 'orbital',
-            'titulo': 'Órbitas Espaciales (Problema de Kepler)',
-            'dificultad': dificultad,
-            'parametros': {
+        x0, y0, vx0, vy0 = _MUESTREADORES[('orbital', nivel)](self._rng)
+        
+        valores = {'x0': x0, 'y0': y0, 'vx0': vx0, 'vy0': vy0}
+        
+        ejercicio = self._construir_ejercicio(
+            sistema='orbital',
+            titulo='Órbitas Espaciales (Problema de Kepler)',
+            dificultad=dificultad,
+            parametros={
                 'x0': x0,
                 'y0': y0,
                 'vx0': vx0,
                 'vy0': vy0,
                 'mu': 1.0
             },
-            'objetivos': [
-                'Comprender las leyes de Kepler',
-                'Analizar órbitas circulares y elípticas',
-                'Verificar la conservación de energía'
-            ],
-            'instrucciones': [
-                f'1. Configure posición inicial: ({x0}, {y0})',
-                f'2. Configure velocidad inicial: ({vx0}, {vy0})',
-                '3. Ejecute la simulación',
-                '4. Observe la trayectoria orbital'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': '¿Qué tipo de órbita se forma?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Circular', 'Elíptica', 'Hiperbólica', 'Parabólica'],
-                    'respuesta_correcta': 0 if abs(vy0 - 1.0) < 0.1 else 1
-                },
-                {
-                    'id': 2,
-                    'texto': '¿La energía total del sistema se conserva?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Sí', 'No'],
-                    'respuesta_correcta': 0
-                },
-                {
-                    'id': 3,
-                    'texto': '¿Qué fuerza actúa sobre el cuerpo orbital?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Gravitacional', 'Electromagnética', 'Nuclear'],
-                    'respuesta_correcta': 0
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar la trayectoria orbital',
-                'Calcular la energía total',
-                'Verificar las leyes de Kepler'
-            ]
-        }
+            objetivos=_ORBITAL_OBJETIVOS,
+            instrucciones=_ORBITAL_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                Pregunta(
+                    id=1,
+                    texto='¿Qué tipo de órbita se forma?',
+                    tipo=_TIPO_MC,
+                    opciones=_OPT_TIPOS_ORBITA,
+                    respuesta_correcta=0 if abs(vy0 - 1.0) < 0.1 else 1
+                ),
+                _ORBITAL_P_ENERGIA,
+                _ORBITAL_P_FUERZA
+            ),
+            analisis_requerido=_ORBITAL_ANALISIS
+        )
         
         return ejercicio
     
-    def _generar_mariposa(self, dificultad):
+    def _generar_mariposa(self, dificultad, nivel):
         """Genera ejercicio del atractor de Rössler (mariposa)."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            a, b, c = 0.2, 0.2, 5.7
-        elif nivel == 2:
-            a, b = 0.2, 0.2
-            c = round(random.uniform(4.0, 6.5), 1)
-        else:
-            a = round(random.uniform(0.1, 0.3), 2)
-            b = round(random.uniform(0.1, 0.4), 2)
-            c = round(random.uniform(3.0, 8.0), 1)
-        
-        ejercicio = {
-            'sistema': 'mariposa',
-            'titulo': 'Atractor de Rössler (Mariposa)',
-            'dificultad': dificultad,
-            'parametros': {
+        a, b, c = _MUESTREADORES[('mariposa', nivel)](self._rng)
+        
+        valores = {'a': a, 'b': b, 'c': c}
+        
+        ejercicio = self._construir_ejercicio(
+            sistema='mariposa',
+            titulo='Atractor de Rössler (Mariposa)',
+            dificultad=dificultad,
+            parametros={
                 'x0': 1.0,
                 'y0': 1.0,
                 'z0': 1.0,
@@ -581,81 +1244,35 @@ class EjercicioGenerator:
                 'b': b,
                 'c': c
             },
-            'objetivos': [
-                'Observar un atractor caótico',
-                'Comparar con el atractor de Lorenz',
-                'Analizar la estructura del atractor'
-            ],
-            'instrucciones': [
-                f'1. Configure a = {a}, b = {b}, c = {c}',
-                '2. Ejecute la simulación',
-                '3. Observe el atractor en 3D',
-                '4. Identifique la forma de mariposa'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': '¿El sistema de Rössler es caótico?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Sí', 'No', 'Depende de los parámetros'],
-                    'respuesta_correcta': 2
-                },
-                {
-                    'id': 2,
-                    'texto': '¿Cuántas dimensiones tiene el sistema?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': 3,
-                    'tolerancia': 0,
-                    'unidad': ''
-                },
-                {
-                    'id': 3,
-                    'texto': 'El atractor de Rössler es:',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Un punto fijo', 'Un ciclo límite', 'Un atractor extraño'],
-                    'respuesta_correcta': 2
-                }
-            ],
-            'analisis_requerido': [
-                'Visualizar el atractor en 3D',
-                'Comparar con Lorenz',
-                'Analizar la sensibilidad a condiciones iniciales'
-            ]
-        }
+            objetivos=_MARIPOSA_OBJETIVOS,
+            instrucciones=_MARIPOSA_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                _MARIPOSA_P_CAOTICO,
+                _MARIPOSA_P_DIMENSIONES,
+                _MARIPOSA_P_ATRACTOR
+            ),
+            analisis_requerido=_MARIPOSA_ANALISIS
+        )
         
         return ejercicio
     
-    def _generar_amortiguador(self, dificultad):
+    def _generar_amortiguador(self, dificultad, nivel):
         """Genera ejercicio de sistema masa-resorte-amortiguador."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            m, k = 1.0, 1.0
-            c = random.choice([0.2, 1.0, 2.0])  # Sub, crítico, sobre
-        elif nivel == 2:
-            m, k = 1.0, 4.0
-            c = round(random.uniform(0.5, 6.0), 1)
-        else:
-            m = round(random.uniform(0.5, 2.0), 1)
-            k = round(random.uniform(1.0, 10.0), 1)
-            c = round(random.uniform(0.1, 8.0), 2)
+        m, k, c = _MUESTREADORES[('amortiguador', nivel)](self._rng)
         
         # Calcular tipo de amortiguamiento
-        c_crit = 2 * np.sqrt(k * m)
+        c_crit = _C_CRITICO.get((m, k))
+        if c_crit is None:
+            c_crit = 2 * math.sqrt(k * m)
         zeta = c / c_crit
         
-        if zeta < 1:
-            tipo = "Subamortiguado"
-        elif abs(zeta - 1) < 0.1:
-            tipo = "Críticamente amortiguado"
-        else:
-            tipo = "Sobreamortiguado"
-        
-        ejercicio = {
-            'sistema': 'amortiguador',
-            'titulo': 'Sistema Masa-Resorte-Amortiguador',
-            'dificultad': dificultad,
-            'parametros': {
+        valores = {'m': m, 'c': c, 'k': k}
+        
+        ejercicio = self._construir_ejercicio(
+            sistema='amortiguador',
+            titulo='Sistema Masa-Resorte-Amortiguador',
+            dificultad=dificultad,
+            parametros={
                 'm': m,
                 'c': c,
                 'k': k,
@@ -664,73 +1281,34 @@ class EjercicioGenerator:
                 'F0': 0.0,
                 'omega_f': 0.0
             },
-            'objetivos': [
-                'Comprender los tipos de amortiguamiento',
-                'Calcular el factor de amortiguamiento ζ',
-                'Analizar la respuesta del sistema'
-            ],
-            'instrucciones': [
-                f'1. Configure m = {m}, c = {c}, k = {k}',
-                '2. Configure x(0) = 1.0, v(0) = 0.0',
-                '3. Ejecute la simulación',
-                '4. Observe el comportamiento'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': '¿Qué tipo de amortiguamiento presenta el sistema?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Subamortiguado', 'Críticamente amortiguado', 'Sobreamortiguado'],
-                    'respuesta_correcta': 0 if zeta < 0.9 else (1 if zeta < 1.1 else 2)
-                },
-                {
-                    'id': 2,
-                    'texto': f'¿Cuál es el factor de amortiguamiento ζ?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': zeta,
-                    'tolerancia': 0.1,
-                    'unidad': ''
-                },
-                {
-                    'id': 3,
-                    'texto': '¿El sistema oscila?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Sí', 'No'],
-                    'respuesta_correcta': 0 if zeta < 1 else 1
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar x(t) y v(t)',
-                'Calcular ζ = c / (2√(km))',
-                'Determinar el tipo de amortiguamiento'
-            ]
-        }
+            objetivos=_AMORT_OBJETIVOS,
+            instrucciones=_AMORT_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                replace(
+                    _AMORT_P_TIPO,
+                    respuesta_correcta=bisect.bisect_right(_ZETA_UMBRALES, zeta)
+                ),
+                replace(_AMORT_P_ZETA, respuesta_esperada=zeta),
+                replace(_AMORT_P_OSCILA, respuesta_correcta=int(zeta >= 1))
+            ),
+            analisis_requerido=_AMORT_ANALISIS
+        )
         
         return ejercicio
     
-    def _generar_rlc(self, dificultad):
+    def _generar_rlc(self, dificultad, nivel):
         """Genera ejercicio de circuito RLC."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            R, L, C = 10.0, 0.1, 0.001
-            V0 = 10.0
-        elif nivel == 2:
-            R = random.randint(5, 50)
-            L = round(random.uniform(0.05, 0.5), 2)
-            C = round(random.uniform(0.0005, 0.005), 4)
-            V0 = random.randint(5, 20)
-        else:
-            R = random.randint(1, 100)
-            L = round(random.uniform(0.01, 1.0), 2)
-            C = round(random.uniform(0.0001, 0.01), 4)
-            V0 = random.randint(1, 50)
-        
-        return {
-            'sistema': 'rlc',
-            'titulo': 'Circuito RLC Serie',
-            'dificultad': dificultad,
-            'parametros': {
+        R, L, C, V0 = _MUESTREADORES[('rlc', nivel)](self._rng)
+        
+        omega_0 = 1 / math.sqrt(L * C)
+        
+        valores = {'R': R, 'L': L, 'C': C, 'V0': V0}
+        
+        return self._construir_ejercicio(
+            sistema='rlc',
+            titulo='Circuito RLC Serie',
+            dificultad=dificultad,
+            parametros={
                 'R': R,
                 'L': L,
                 'C': C,
@@ -738,61 +1316,30 @@ class EjercicioGenerator:
                 'I0': 0.0,
                 'Q0': 0.0
             },
-            'objetivos': [
-                'Comprender circuitos RLC',
-                'Analizar oscilaciones eléctricas',
-                'Calcular la frecuencia de resonancia'
-            ],
-            'instrucciones': [
-                f'1. Configure R = {R}Ω, L = {L}H, C = {C}F',
-                f'2. Configure V₀ = {V0}V',
-                '3. Ejecute la simulación',
-                '4. Observe corriente y voltaje'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': '¿Cuál es la frecuencia de resonancia ω₀ = 1/√(LC)?',
-                    'tipo': 'numerica',
-                    'respuesta_esperada': 1 / np.sqrt(L * C),
-                    'tolerancia': 5.0,
-                    'unidad': 'rad/s'
-                },
-                {
-                    'id': 2,
-                    'texto': '¿El circuito está subamortiguado, críticamente amortiguado o sobreamortiguado?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Subamortiguado', 'Críticamente amortiguado', 'Sobreamortiguado'],
-                    'respuesta_correcta': 0 if R < 2 * np.sqrt(L / C) else 2
-                }
-            ],
-            'analisis_requerido': [
-                'Graficar I(t) y V_C(t)',
-                'Calcular ω₀ = 1/√(LC)',
-                'Determinar el factor de calidad Q'
-            ]
-        }
+            objetivos=_RLC_OBJETIVOS,
+            instrucciones=_RLC_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                replace(_RLC_P_RESONANCIA, respuesta_esperada=omega_0),
+                # Subamortiguado si R < 2·√(L/C), si no sobreamortiguado
+                replace(
+                    _RLC_P_AMORTIGUAMIENTO,
+                    respuesta_correcta=2 * (R >= 2 * math.sqrt(L / C))
+                )
+            ),
+            analisis_requerido=_RLC_ANALISIS
+        )
     
-    def _generar_lorenz(self, dificultad):
+    def _generar_lorenz(self, dificultad, nivel):
         """Genera ejercicio del sistema de Lorenz."""
-        nivel = self.DIFICULTAD[dificultad]
-        
-        if nivel == 1:
-            sigma, rho, beta = 10.0, 28.0, 8/3
-        elif nivel == 2:
-            sigma = 10.0
-            rho = round(random.uniform(20.0, 35.0), 1)
-            beta = 8/3
-        else:
-            sigma = round(random.uniform(8.0, 15.0), 1)
-            rho = round(random.uniform(15.0, 40.0), 1)
-            beta = round(random.uniform(2.0, 3.5), 2)
-        
-        return {
-            'sistema': 'lorenz',
-            'titulo': 'Sistema de Lorenz (Atractor Caótico)',
-            'dificultad': dificultad,
-            'parametros': {
+        sigma, rho, beta = _MUESTREADORES[('lorenz', nivel)](self._rng)
+        
+        valores = {'sigma': sigma, 'rho': rho, 'beta': beta}
+        
+        return self._construir_ejercicio(
+            sistema='lorenz',
+            titulo='Sistema de Lorenz (Atractor Caótico)',
+            dificultad=dificultad,
+            parametros={
                 'x0': 1.0,
                 'y0': 1.0,
                 'z0': 1.0,
@@ -800,36 +1347,11 @@ class EjercicioGenerator:
                 'rho': rho,
                 'beta': beta
             },
-            'objetivos': [
-                'Observar comportamiento caótico',
-                'Comprender la teoría del caos',
-                'Analizar el atractor extraño'
-            ],
-            'instrucciones': [
-                f'1. Configure σ = {sigma}, ρ = {rho}, β = {beta:.2f}',
-                '2. Ejecute la simulación',
-                '3. Observe el atractor en 3D',
-                '4. Analice la sensibilidad a condiciones iniciales'
-            ],
-            'preguntas': [
-                {
-                    'id': 1,
-                    'texto': '¿El sistema de Lorenz es determinista o estocástico?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Determinista', 'Estocástico'],
-                    'respuesta_correcta': 0
-                },
-                {
-                    'id': 2,
-                    'texto': 'Para ρ > 24.74, ¿qué comportamiento exhibe?',
-                    'tipo': 'opcion_multiple',
-                    'opciones': ['Punto fijo', 'Ciclo límite', 'Comportamiento caótico'],
-                    'respuesta_correcta': 2 if rho > 24.74 else 0
-                }
-            ],
-            'analisis_requerido': [
-                'Visualizar el atractor en 3D',
-                'Probar diferentes condiciones iniciales',
-                'Observar la sensibilidad al caos'
-            ]
-        }
+            objetivos=_LORENZ_OBJETIVOS,
+            instrucciones=_LORENZ_INSTRUCCIONES.format_map(valores).split('\n'),
+            preguntas=(
+                _LORENZ_P_DETERMINISTA,
+                replace(_LORENZ_P_CAOS, respuesta_correcta=2 * (rho > 24.74))
+            ),
+            analisis_requerido=_LORENZ_ANALISIS
+        )
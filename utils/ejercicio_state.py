@@ -3,153 +3,169 @@ Gestor de estado global para ejercicios de laboratorio.
 Permite guardar y recuperar el ejercicio activo cuando el estudiante navega.
 """
 
+from dataclasses import dataclass, field
 
-class EjercicioState:
-    """
-    Singleton para gestionar el estado del ejercicio actual.
-    Permite que el ejercicio persista entre navegaciones.
-    """
-    
-    _instance = None
-    _ejercicio_actual = None
-    _respuestas_guardadas = {}
-    _simulacion_ejecutada = False
-    _datos_simulacion = None
+
+@dataclass(slots=True)
+class _EjercicioStateData:
+    """Estado del ejercicio activo, compartido por todo el proceso."""
     
-    def __new__(cls):
-        """Implementa el patrón Singleton."""
-        if cls._instance is None:
-            cls._instance = super(EjercicioState, cls).__new__(cls)
-        return cls._instance
+    ejercicio_actual: object = None
+    respuestas_guardadas: dict = field(default_factory=dict)
+    simulacion_ejecutada: bool = False
+    datos_simulacion: object = None
+
+
+_state = _EjercicioStateData()
+
+
+def set_ejercicio(ejercicio):
+    """
+    Guarda el ejercicio actual.
     
-    @classmethod
-    def set_ejercicio(cls, ejercicio):
-        """
-        Guarda el ejercicio actual.
-        
-        Args:
-            ejercicio: Diccionario con los datos del ejercicio
-        """
-        cls._ejercicio_actual = ejercicio
-        cls._respuestas_guardadas = {}
-        cls._simulacion_ejecutada = False
-        cls._datos_simulacion = None
+    Args:
+        ejercicio: Ejercicio generado (instancia de Ejercicio)
+    """
+    _state.ejercicio_actual = ejercicio
+    _state.respuestas_guardadas.clear()
+    _state.simulacion_ejecutada = False
+    _state.datos_simulacion = None
+
+
+def get_ejercicio():
+    """
+    Obtiene el ejercicio actual.
     
-    @classmethod
-    def get_ejercicio(cls):
-        """
-        Obtiene el ejercicio actual.
-        
-        Returns:
-            Diccionario con el ejercicio o None
-        """
-        return cls._ejercicio_actual
+    Returns:
+        Instancia de Ejercicio o None
+    """
+    return _state.ejercicio_actual
+
+
+def clear_ejercicio():
+    """Limpia el ejercicio actual."""
+    _state.ejercicio_actual = None
+    _state.respuestas_guardadas.clear()
+    _state.simulacion_ejecutada = False
+    _state.datos_simulacion = None
+
+
+def tiene_ejercicio():
+    """
+    Verifica si hay un ejercicio activo.
     
-    @classmethod
-    def clear_ejercicio(cls):
-        """Limpia el ejercicio actual."""
-        cls._ejercicio_actual = None
-        cls._respuestas_guardadas = {}
-        cls._simulacion_ejecutada = False
-        cls._datos_simulacion = None
+    Returns:
+        bool: True si hay ejercicio activo
+    """
+    return _state.ejercicio_actual is not None
+
+
+def set_respuesta(pregunta_id, respuesta):
+    """
+    Guarda una respuesta.
     
-    @classmethod
-    def tiene_ejercicio(cls):
-        """
-        Verifica si hay un ejercicio activo.
-        
-        Returns:
-            bool: True si hay ejercicio activo
-        """
-        return cls._ejercicio_actual is not None
+    Args:
+        pregunta_id: ID de la pregunta
+        respuesta: Respuesta del estudiante
+    """
+    _state.respuestas_guardadas[pregunta_id] = respuesta
+
+
+def get_respuestas():
+    """
+    Obtiene todas las respuestas guardadas.
     
-    @classmethod
-    def set_respuesta(cls, pregunta_id, respuesta):
-        """
-        Guarda una respuesta.
-        
-        Args:
-            pregunta_id: ID de la pregunta
-            respuesta: Respuesta del estudiante
-        """
-        cls._respuestas_guardadas[pregunta_id] = respuesta
+    Returns:
+        Diccionario con las respuestas
+    """
+    return _state.respuestas_guardadas.copy()
+
+
+def set_simulacion_ejecutada(ejecutada=True, datos=None):
+    """
+    Marca que la simulación fue ejecutada.
     
-    @classmethod
-    def get_respuestas(cls):
-        """
-        Obtiene todas las respuestas guardadas.
-        
-        Returns:
-            Diccionario con las respuestas
-        """
-        return cls._respuestas_guardadas.copy()
+    Args:
+        ejecutada: Si la simulación fue ejecutada
+        datos: Datos de la simulación (opcional)
+    """
+    _state.simulacion_ejecutada = ejecutada
+    _state.datos_simulacion = datos
+
+
+def simulacion_fue_ejecutada():
+    """
+    Verifica si la simulación fue ejecutada.
     
-    @classmethod
-    def set_simulacion_ejecutada(cls, ejecutada=True, datos=None):
-        """
-        Marca que la simulación fue ejecutada.
-        
-        Args:
-            ejecutada: Si la simulación fue ejecutada
-            datos: Datos de la simulación (opcional)
-        """
-        cls._simulacion_ejecutada = ejecutada
-        cls._datos_simulacion = datos
+    Returns:
+        bool: True si fue ejecutada
+    """
+    return _state.simulacion_ejecutada
+
+
+def get_datos_simulacion():
+    """
+    Obtiene los datos de la simulación.
     
-    @classmethod
-    def simulacion_fue_ejecutada(cls):
-        """
-        Verifica si la simulación fue ejecutada.
-        
-        Returns:
-            bool: True si fue ejecutada
-        """
-        return cls._simulacion_ejecutada
+    Returns:
+        Datos de la simulación o None
+    """
+    return _state.datos_simulacion
+
+
+def get_parametros_ejercicio():
+    """
+    Obtiene los parámetros del ejercicio actual.
     
-    @classmethod
-    def get_datos_simulacion(cls):
-        """
-        Obtiene los datos de la simulación.
-        
-        Returns:
-            Datos de la simulación o None
-        """
-        return cls._datos_simulacion
+    Returns:
+        Diccionario con parámetros o None
+    """
+    if _state.ejercicio_actual:
+        return _state.ejercicio_actual.get('parametros', {})
+    return None
+
+
+def get_sistema_ejercicio():
+    """
+    Obtiene el sistema del ejercicio actual.
     
-    @classmethod
-    def get_parametros_ejercicio(cls):
-        """
-        Obtiene los parámetros del ejercicio actual.
-        
-        Returns:
-            Diccionario con parámetros o None
-        """
-        if cls._ejercicio_actual:
-            return cls._ejercicio_actual.get('parametros', {})
-        return None
+    Returns:
+        String con el nombre del sistema o None
+    """
+    if _state.ejercicio_actual:
+        return _state.ejercicio_actual.get('sistema')
+    return None
+
+
+def get_info_ejercicio():
+    """
+    Obtiene información resumida del ejercicio.
     
-    @classmethod
-    def get_sistema_ejercicio(cls):
-        """
-        Obtiene el sistema del ejercicio actual.
-        
-        Returns:
-            String con el nombre del sistema o None
-        """
-        if cls._ejercicio_actual:
-            return cls._ejercicio_actual.get('sistema')
-        return None
+    Returns:
+        String con información o None
+    """
+    if _state.ejercicio_actual:
+        titulo = _state.ejercicio_actual.get('titulo', 'Sin título')
+        dificultad = _state.ejercicio_actual.get('dificultad', 'intermedio')
+        return f"{titulo} ({dificultad.upper()})"
+    return None
+
+
+class EjercicioState:
+    """
+    Fachada de compatibilidad sobre las funciones del módulo.
+    Permite que el ejercicio persista entre navegaciones.
+    """
     
-    @classmethod
-    def get_info_ejercicio(cls):
-        """
-        Obtiene información resumida del ejercicio.
-        
-        Returns:
-            String con información o None
-        """
-        if cls._ejercicio_actual:
-            titulo = cls._ejercicio_actual.get('titulo', 'Sin título')
-            dificultad = cls._ejercicio_actual.get('dificultad', 'intermedio')
-            return f"{titulo} ({dificultad.upper()})"
-        return None
+    set_ejercicio = staticmethod(set_ejercicio)
+    get_ejercicio = staticmethod(get_ejercicio)
+    clear_ejercicio = staticmethod(clear_ejercicio)
+    tiene_ejercicio = staticmethod(tiene_ejercicio)
+    set_respuesta = staticmethod(set_respuesta)
+    get_respuestas = staticmethod(get_respuestas)
+    set_simulacion_ejecutada = staticmethod(set_simulacion_ejecutada)
+    simulacion_fue_ejecutada = staticmethod(simulacion_fue_ejecutada)
+    get_datos_simulacion = staticmethod(get_datos_simulacion)
+    get_parametros_ejercicio = staticmethod(get_parametros_ejercicio)
+    get_sistema_ejercicio = staticmethod(get_sistema_ejercicio)
+    get_info_ejercicio = staticmethod(get_info_ejercicio)